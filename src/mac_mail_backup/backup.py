@@ -5,15 +5,18 @@ Core backup functionality for Mac Mail.
 import os
 import sys
 import re
+import ctypes
 import sqlite3
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from urllib.parse import unquote
 from collections import defaultdict
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Any, Tuple
 
-from .converter import MboxConverter
+from .converter import MboxConverter, _walk_tree
 
 
 class Colors:
@@ -29,13 +32,131 @@ class Colors:
     END = '\033[0m'
 
 
+# Whether stdout is a terminal cannot change while we run, so check once
+_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+
+
 def colorize(text: str, color_code: str) -> str:
     """Apply color to text if terminal supports it."""
-    if sys.stdout.isatty():
+    if _IS_TTY:
         return f"{color_code}{text}{Colors.END}"
     return text
 
 
+def _iter_files(path: Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield a DirEntry for every regular file under a directory.
+
+    Classification comes from the directory listing, so callers that only
+    need names never stat at all.
+    """
+    for _, entry in _walk_tree(str(path)):
+        try:
+            if entry.is_file(follow_symlinks=False):
+                yield entry
+        except OSError:
+            continue  # Entry vanished mid-scan
+
+
+def _file_size(entry: os.DirEntry) -> int:
+    """Size of a scanned file, or 0 if it disappeared since the scan."""
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+
+def _load_clonefile() -> Optional[Any]:
+    """Return libSystem's clonefile(2), or None where it is unavailable."""
+    if sys.platform != 'darwin':
+        return None
+    try:
+        clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+_clonefile = _load_clonefile()
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hardlink a delivered emlx into place, and copy everything else.
+
+    Mail never rewrites an emlx once delivered, so a link is as good as a
+    copy. Plists, attachments and .partial.emlx files can change in place,
+    and a link would carry those writes into the backup (and back).
+    """
+    delivered = src.endswith('.emlx') and not src.endswith('.partial.emlx')
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        if delivered:
+            return  # Already linked by an earlier run
+        os.unlink(dst)  # Never overwrite the live file through a link
+    if delivered:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # Fall back to a copy
+    shutil.copy2(src, dst)
+
+
+def _copy_tree(src: Path, dst: Path) -> None:
+    """
+    Copy a directory tree as cheaply as the filesystem allows.
+
+    On APFS, clonefile(2) duplicates the whole tree as a metadata-only
+    operation. Otherwise, when source and destination share a volume,
+    delivered emlx files are hardlinked and the rest copied (see
+    _link_or_copy). Anything else gets a regular copy.
+    """
+    if _clonefile is not None and not dst.exists():
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return
+    if os.stat(src).st_dev == os.stat(dst.parent).st_dev:
+        shutil.copytree(src, dst, copy_function=_link_or_copy, dirs_exist_ok=True)
+    else:
+        shutil.copytree(src, dst, dirs_exist_ok=True)
+
+
+def _connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a SQLite database read-only, tuned for a one-off bulk scan.
+
+    Read-only mode never writes a journal or takes write locks, so it
+    cannot contend with a running Mail.app.
+    """
+    conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+
+# Upper bound on accounts backed up concurrently
+MAX_BACKUP_WORKERS = 4
+
+# Account types by mailbox URL scheme
+_ACCOUNT_TYPES = {
+    'imap': 'IMAP',
+    'ews': 'Exchange',
+    'local': 'Local',
+    'pop': 'POP',
+}
+
+# Units for human-readable sizes, each 1024 times the previous
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Mail data version directories (V10, V9, etc.)
+_VERSION_DIR_RE = re.compile(r'^V(\d+)$')
+
+# Characters not allowed in backup directory names
+_UNSAFE_NAME_RE = re.compile(r'[^\w\-_]')
+
+
 class MacMailBackup:
     """
     Main backup class for Apple Mail on macOS.
@@ -47,26 +168,48 @@ class MacMailBackup:
     - Backing up to native and mbox formats
     """
 
-    def __init__(self, output_dir: Optional[str] = None, verbose: bool = True):
+    def __init__(
+        self,
+        output_dir: Optional[str] = None,
+        verbose: bool = True,
+        workers: int = 1,
+        use_cache: bool = True
+    ):
         """
         Initialize the backup tool.
 
         Args:
             output_dir: Directory for backup output. Defaults to current directory.
             verbose: If True, print progress information.
+            workers: Number of processes converting each account's mailboxes.
+                     Up to MAX_BACKUP_WORKERS accounts convert at once, each
+                     with its own pool.
+            use_cache: If True, reuse 'From ' lines cached by earlier backups
+                       for messages that have not changed.
         """
-        self.mail_dir = Path.home() / "Library" / "Mail"
+        home = Path.home()
+        self.mail_dir = home / "Library" / "Mail"
+        self.accounts_db_path = home / "Library" / "Accounts" / "Accounts4.sqlite"
         self.output_dir = Path(output_dir) if output_dir else Path.cwd()
         self.verbose = verbose
         self.accounts: Dict[str, Dict[str, Any]] = {}
         self.mail_version: Optional[Path] = None
+        self.envelope_path: Optional[Path] = None
         self.envelope_db: Optional[sqlite3.Connection] = None
-        self.converter = MboxConverter(verbose=verbose)
+        self.cache_path = home / "Library" / "Caches" / "mac-mail-backup" / "from_lines.sqlite"
+        # MboxConverter holds no per-conversion state, so workers can share it
+        self.converter = MboxConverter(
+            verbose=verbose,
+            workers=workers,
+            cache_path=str(self.cache_path) if use_cache else None
+        )
+        self._print_lock = threading.Lock()
 
     def _print(self, message: str, end: str = '\n', flush: bool = False) -> None:
         """Print message if verbose mode is enabled."""
         if self.verbose:
-            print(message, end=end, flush=flush)
+            with self._print_lock:
+                print(message, end=end, flush=flush)
 
     def find_mail_version(self) -> Path:
         """
@@ -84,12 +227,14 @@ class MacMailBackup:
                 "Make sure Apple Mail is configured on this system."
             )
 
-        # Find version directories (V10, V9, etc.)
-        versions = sorted(
-            [d for d in self.mail_dir.iterdir() if d.is_dir() and d.name.startswith('V')],
-            key=lambda x: int(x.name[1:]) if x.name[1:].isdigit() else 0,
-            reverse=True
-        )
+        # Find version directories (V10, V9, etc.), newest first
+        versions = []
+        with os.scandir(self.mail_dir) as it:
+            for entry in it:
+                match = _VERSION_DIR_RE.match(entry.name)
+                if match and entry.is_dir():
+                    versions.append((int(match.group(1)), Path(entry.path)))
+        versions.sort(reverse=True)
 
         if not versions:
             raise FileNotFoundError(
@@ -97,7 +242,8 @@ class MacMailBackup:
                 "Make sure Apple Mail has been used at least once."
             )
 
-        self.mail_version = versions[0]
+        self.mail_version = versions[0][1]
+        self.envelope_path = self.mail_version / "MailData" / "Envelope Index"
         self._print(f"Found Mail data: {colorize(str(self.mail_version), Colors.CYAN)}")
         return self.mail_version
 
@@ -105,114 +251,153 @@ class MacMailBackup:
         """
         Discover all mail accounts and their details.
 
+        Only the cheap details (type, path, mailboxes) are filled in here;
+        email and display name are resolved on demand by _resolve_details.
+
         Returns:
             Dictionary mapping account UUIDs to account information.
         """
         if not self.mail_version:
             self.find_mail_version()
+        if self.envelope_path is None:
+            self.envelope_path = self.mail_version / "MailData" / "Envelope Index"
 
         # Open the Envelope Index database
-        envelope_path = self.mail_version / "MailData" / "Envelope Index"
-        if not envelope_path.exists():
-            raise FileNotFoundError(f"Envelope Index not found: {envelope_path}")
+        if not self.envelope_path.exists():
+            raise FileNotFoundError(f"Envelope Index not found: {self.envelope_path}")
 
-        self.envelope_db = sqlite3.connect(str(envelope_path))
+        self.envelope_db = _connect_readonly(self.envelope_path)
 
-        # Get unique accounts from mailbox URLs
+        # Get unique (account, mailbox) pairs from mailbox URLs. The UUID
+        # check and mailbox path extraction happen in SQL so DISTINCT can
+        # collapse duplicates before rows reach Python. This is a full
+        # table scan regardless, so keep the per-row work to plain substr()
+        # calls and map schemes to account types in Python instead.
         cursor = self.envelope_db.cursor()
         cursor.execute("""
             SELECT DISTINCT
-                CASE
-                    WHEN url LIKE 'imap://%' THEN 'IMAP'
-                    WHEN url LIKE 'ews://%' THEN 'Exchange'
-                    WHEN url LIKE 'local://%' THEN 'Local'
-                    WHEN url LIKE 'pop://%' THEN 'POP'
-                    ELSE 'Other'
-                END as type,
+                lower(substr(url, 1, instr(url, '://')-1)) as scheme,
                 substr(url, instr(url, '//')+2, 36) as account_uuid,
-                url
+                substr(url, instr(url, '//')+2+37) as mailbox_path
             FROM mailboxes
-            WHERE url LIKE '%://%'
+            WHERE url GLOB '*://*'
+              AND length(substr(url, instr(url, '//')+2, 36)) = 36
         """)
 
         account_data: Dict[str, Dict[str, Any]] = defaultdict(
             lambda: {'type': '', 'uuid': '', 'mailboxes': [], 'path': None}
         )
 
-        for row in cursor.fetchall():
-            acc_type, uuid, url = row
-            if uuid and len(uuid) == 36:  # Valid UUID format
-                account_data[uuid]['type'] = acc_type
-                account_data[uuid]['uuid'] = uuid
-                # Extract mailbox path from URL
-                if '/' in url:
-                    mailbox_path = unquote(url.split('/', 3)[-1]) if url.count('/') >= 3 else ''
-                    if mailbox_path and mailbox_path not in account_data[uuid]['mailboxes']:
-                        account_data[uuid]['mailboxes'].append(mailbox_path)
-
-        # Find actual directories and resolve email addresses
+        for scheme, uuid, mailbox_path in cursor:
+            account_data[uuid]['type'] = _ACCOUNT_TYPES.get(scheme, 'Other')
+            account_data[uuid]['uuid'] = uuid
+            if mailbox_path:
+                mailbox_path = unquote(mailbox_path)
+                if mailbox_path not in account_data[uuid]['mailboxes']:
+                    account_data[uuid]['mailboxes'].append(mailbox_path)
+
+        # Find actual directories
         for uuid, data in account_data.items():
             account_path = self.mail_version / uuid
             if account_path.exists():
                 data['path'] = account_path
-                data['email'] = self._resolve_account_email(uuid, data['type'])
-                data['display_name'] = self._generate_display_name(data)
 
         self.accounts = dict(account_data)
         return self.accounts
 
-    def _resolve_account_email(self, uuid: str, acc_type: str) -> str:
+    def _resolve_details(self, uuids: List[str]) -> None:
         """
-        Resolve the email address for an account.
+        Fill in email and display name for accounts that lack them.
 
-        Uses macOS Accounts database for reliable account identification.
+        Args:
+            uuids: The account UUIDs that need details.
+        """
+        pending = [
+            uuid for uuid in uuids
+            if uuid in self.accounts
+            and self.accounts[uuid]['path'] is not None
+            and 'display_name' not in self.accounts[uuid]
+        ]
+        if not pending:
+            return
+
+        # Resolve email addresses with a single Accounts database lookup
+        account_rows = self._resolve_all_emails(pending)
+        for uuid in pending:
+            data = self.accounts[uuid]
+            data['email'] = self._resolve_account_email(data['type'], account_rows.get(uuid))
+            data['display_name'] = self._generate_display_name(data)
+
+    def _resolve_all_emails(self, uuids: List[str]) -> Dict[str, Tuple[Any, ...]]:
+        """
+        Look up several accounts in the macOS Accounts database at once.
+
+        Opens the database and runs a single query for all UUIDs rather
+        than one connection and query per account.
 
         Args:
-            uuid: The account UUID.
-            acc_type: The account type (IMAP, Exchange, etc.).
+            uuids: The account UUIDs to look up.
 
         Returns:
-            The email address or a descriptive fallback.
+            Dictionary mapping account UUIDs to (description, username,
+            parent description, parent username) rows.
         """
-        # Try macOS Accounts database (most reliable source)
-        accounts_db_path = Path.home() / "Library" / "Accounts" / "Accounts4.sqlite"
-        if accounts_db_path.exists():
-            try:
-                accounts_db = sqlite3.connect(str(accounts_db_path))
-                cursor = accounts_db.cursor()
+        rows: Dict[str, Tuple[Any, ...]] = {}
+        if not uuids or not self.accounts_db_path.exists():
+            return rows
 
+        try:
+            accounts_db = _connect_readonly(self.accounts_db_path)
+            try:
                 # Query for account info including parent account
-                cursor.execute("""
+                placeholders = ','.join('?' * len(uuids))
+                cursor = accounts_db.execute(f"""
                     SELECT
+                        z.ZIDENTIFIER,
                         z.ZACCOUNTDESCRIPTION,
                         z.ZUSERNAME,
                         p.ZACCOUNTDESCRIPTION as parent_desc,
                         p.ZUSERNAME as parent_user
                     FROM ZACCOUNT z
                     LEFT JOIN ZACCOUNT p ON z.ZPARENTACCOUNT = p.Z_PK
-                    WHERE z.ZIDENTIFIER = ?
-                """, (uuid,))
-
-                row = cursor.fetchone()
+                    WHERE z.ZIDENTIFIER IN ({placeholders})
+                """, uuids)
+                for identifier, *info in cursor:
+                    rows.setdefault(identifier, tuple(info))
+            finally:
                 accounts_db.close()
+        except Exception:
+            pass  # Callers fall back to type-based names
+
+        return rows
+
+    def _resolve_account_email(self, acc_type: str, row: Optional[Tuple[Any, ...]]) -> str:
+        """
+        Resolve the email address for an account.
+
+        Uses macOS Accounts database for reliable account identification.
 
-                if row:
-                    desc, username, parent_desc, parent_user = row
+        Args:
+            acc_type: The account type (IMAP, Exchange, etc.).
+            row: The account's Accounts database row, if one was found.
 
-                    # Prefer direct username with @, then parent username
-                    if username and '@' in str(username):
-                        return username
-                    if parent_user and '@' in str(parent_user):
-                        return parent_user
+        Returns:
+            The email address or a descriptive fallback.
+        """
+        if row:
+            desc, username, parent_desc, parent_user = row
 
-                    # Use description if it looks like an email or account name
-                    if desc and desc not in ('', 'On My Mac'):
-                        return desc
-                    if parent_desc and parent_desc not in ('', 'On My Mac'):
-                        return parent_desc
+            # Prefer direct username with @, then parent username
+            if username and '@' in str(username):
+                return username
+            if parent_user and '@' in str(parent_user):
+                return parent_user
 
-            except Exception:
-                pass  # Fall through to fallback methods
+            # Use description if it looks like an email or account name
+            if desc and desc not in ('', 'On My Mac'):
+                return desc
+            if parent_desc and parent_desc not in ('', 'On My Mac'):
+                return parent_desc
 
         # Fallback: return generic type-based name
         type_names = {
@@ -271,61 +456,65 @@ class MacMailBackup:
 
         return f"{acc_type} Account ({data['uuid'][:8]}...)"
 
-    def list_accounts(self) -> List[str]:
+    def list_accounts(self, show_stats: bool = True) -> List[str]:
         """
         Print discovered accounts in a user-friendly format.
 
+        Args:
+            show_stats: If True, scan each account for its email count and size.
+
         Returns:
             List of account UUIDs.
         """
         if not self.accounts:
             self.discover_accounts()
 
+        self._resolve_details(list(self.accounts))
+
         self._print(f"\n{colorize('═' * 60, Colors.BLUE)}")
         self._print(colorize("  DISCOVERED MAIL ACCOUNTS", Colors.BOLD))
         self._print(f"{colorize('═' * 60, Colors.BLUE)}\n")
 
         valid_accounts = []
         for i, (uuid, data) in enumerate(self.accounts.items(), 1):
-            if data['path'] and data['path'].exists():
+            # discover_accounts only sets 'path' for directories that exist
+            if data['path'] is not None:
                 valid_accounts.append(uuid)
-                email_count = self._count_emails(data['path'])
-                size = self._get_dir_size(data['path'])
 
                 self._print(f"  {colorize(f'[{len(valid_accounts)}]', Colors.GREEN)} "
                            f"{colorize(data['display_name'], Colors.BOLD)}")
                 self._print(f"      Type: {data['type']}")
-                self._print(f"      Emails: ~{email_count:,}")
-                self._print(f"      Size: {self._format_size(size)}")
+                if show_stats:
+                    email_count, size = self._account_stats(data)
+                    self._print(f"      Emails: ~{email_count:,}")
+                    self._print(f"      Size: {self._format_size(size)}")
                 self._print(f"      Folders: {len(data['mailboxes'])}")
                 self._print("")
 
         return valid_accounts
 
-    def _count_emails(self, path: Path) -> int:
-        """Count emlx files in a directory."""
-        count = 0
-        for root, dirs, files in os.walk(path):
-            count += sum(1 for f in files if f.endswith('.emlx'))
-        return count
+    def _account_stats(self, data: Dict[str, Any]) -> Tuple[int, int]:
+        """Return (email count, size in bytes) for an account, scanning it once."""
+        stats: Optional[Tuple[int, int]] = data.get('_stats')
+        if stats is None:
+            stats = data['_stats'] = self._scan_stats(data['path'])
+        return stats
 
-    def _get_dir_size(self, path: Path) -> int:
-        """Get total size of a directory in bytes."""
+    def _scan_stats(self, path: Path) -> Tuple[int, int]:
+        """Count emlx files and total bytes in a directory in a single pass."""
+        count = 0
         total = 0
-        for root, dirs, files in os.walk(path):
-            for f in files:
-                fp = os.path.join(root, f)
-                if os.path.exists(fp):
-                    total += os.path.getsize(fp)
-        return total
+        for entry in _iter_files(path):
+            if entry.name.endswith('.emlx'):
+                count += 1
+            total += _file_size(entry)
+        return count, total
 
     def _format_size(self, size: int) -> str:
         """Format size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        # Each unit is 2**10 larger, so the bit length picks it directly
+        i = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size > 0 else 0
+        return f"{size / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
     def select_accounts_interactive(self, account_uuids: List[str]) -> List[str]:
         """
@@ -363,22 +552,32 @@ class MacMailBackup:
             except (ValueError, IndexError):
                 self._print(colorize("Invalid input. Enter numbers separated by commas.", Colors.RED))
 
-    def backup_account(self, uuid: str, backup_dir: Path) -> bool:
+    def backup_account(
+        self,
+        uuid: str,
+        backup_dir: Path,
+        log: Optional[Callable[[str], None]] = None
+    ) -> bool:
         """
         Backup a single account.
 
         Args:
             uuid: Account UUID.
             backup_dir: Base backup directory.
+            log: Called with each complete progress line. Defaults to
+                 printing it when verbose.
 
         Returns:
             True if backup succeeded, False otherwise.
         """
+        log = log or self._print
         data = self.accounts.get(uuid)
         if not data or not data['path'] or not data['path'].exists():
-            self._print(f"  {colorize('✗', Colors.RED)} Account path not found")
+            log(f"  {colorize('✗', Colors.RED)} Account path not found")
             return False
 
+        self._resolve_details([uuid])
+
         # Create safe directory name from email
         email = data.get('email', '')
         if '@' in email:
@@ -387,86 +586,111 @@ class MacMailBackup:
             account_name = f"{data['type']}_{uuid[:8]}"
 
         # Sanitize for filesystem
-        account_name = re.sub(r'[^\w\-_]', '_', account_name)
+        account_name = _UNSAFE_NAME_RE.sub('_', account_name)
         account_backup_dir = backup_dir / account_name
 
-        self._print(f"\n  Backing up: {colorize(data['display_name'], Colors.BOLD)}")
+        log(f"\n  Backing up: {colorize(data['display_name'], Colors.BOLD)}")
 
         # Create backup directory
         account_backup_dir.mkdir(parents=True, exist_ok=True)
 
-        # 1. Copy raw Mail data
+        # 1. Copy raw Mail data in the background while converting. Both
+        # steps only read the source tree, so they can run side by side.
         raw_dir = account_backup_dir / "Mail_Raw_Data"
-        self._print(f"    Copying raw data...", end=' ', flush=True)
-        try:
-            shutil.copytree(data['path'], raw_dir, dirs_exist_ok=True)
-            self._print(colorize("✓", Colors.GREEN))
-        except Exception as e:
-            self._print(colorize(f"✗ {e}", Colors.RED))
-            return False
-
-        # 2. Convert to mbox format
         mbox_dir = account_backup_dir / "mbox_format"
         mbox_dir.mkdir(exist_ok=True)
-        self._print(f"    Converting to mbox format...")
-        email_counts = self.converter.convert_account(str(raw_dir), str(mbox_dir))
+        with ThreadPoolExecutor(max_workers=1) as copier:
+            copy_job = copier.submit(_copy_tree, data['path'], raw_dir)
+
+            # 2. Convert to mbox format
+            log(f"    Converting to mbox format...")
+            result = self.converter.convert_account(
+                str(data['path']), str(mbox_dir), progress=log
+            )
 
-        # 3. Generate account summary
-        self._write_account_summary(account_backup_dir, data, email_counts)
+            try:
+                copy_job.result()
+                log(f"    Copying raw data... {colorize('✓', Colors.GREEN)}")
+            except Exception as e:
+                log(f"    Copying raw data... {colorize(f'✗ {e}', Colors.RED)}")
+                return False
+
+        # 3. Generate account summary (raw data is a copy of the scanned source)
+        raw_size = self._account_stats(data)[1]
+        self._write_account_summary(
+            account_backup_dir, data, result['per_folder_counts'], raw_size, result['mbox_bytes']
+        )
+        data['_backup_size'] = raw_size + result['mbox_bytes']
 
         return True
 
+    def _backup_account_buffered(self, uuid: str, backup_dir: Path) -> bool:
+        """Backup an account, printing its progress lines together at the end."""
+        lines: List[str] = []
+        try:
+            return self.backup_account(uuid, backup_dir, log=lines.append)
+        finally:
+            if lines:
+                self._print('\n'.join(lines))
+
     def _write_account_summary(
         self,
         backup_dir: Path,
         account_data: Dict[str, Any],
-        email_counts: Dict[str, int]
+        email_counts: Dict[str, int],
+        raw_size: int,
+        mbox_size: int
     ) -> None:
         """Write a summary file for the account backup."""
         summary_path = backup_dir / "BACKUP_INFO.txt"
 
         total_emails = sum(email_counts.values())
-        raw_size = self._get_dir_size(backup_dir / "Mail_Raw_Data")
-        mbox_size = self._get_dir_size(backup_dir / "mbox_format")
+
+        # Assemble the whole file first so it goes out in a single write
+        lines = [
+            "=" * 60 + "\n",
+            f"  MAIL BACKUP: {account_data.get('email', 'Unknown')}\n",
+            "=" * 60 + "\n\n",
+            f"Backup Date:     {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Account Type:    {account_data['type']}\n",
+            f"Account UUID:    {account_data['uuid']}\n",
+            f"Total Emails:    {total_emails:,}\n",
+            f"Raw Data Size:   {self._format_size(raw_size)}\n",
+            f"Mbox Size:       {self._format_size(mbox_size)}\n\n",
+            "FOLDER BREAKDOWN:\n",
+            "-" * 40 + "\n",
+        ]
+        for folder, count in sorted(email_counts.items()):
+            lines.append(f"  {folder}: {count:,} emails\n")
+        lines.append("\n" + "=" * 60 + "\n")
 
         with open(summary_path, 'w') as f:
-            f.write("=" * 60 + "\n")
-            f.write(f"  MAIL BACKUP: {account_data.get('email', 'Unknown')}\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Backup Date:     {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Account Type:    {account_data['type']}\n")
-            f.write(f"Account UUID:    {account_data['uuid']}\n")
-            f.write(f"Total Emails:    {total_emails:,}\n")
-            f.write(f"Raw Data Size:   {self._format_size(raw_size)}\n")
-            f.write(f"Mbox Size:       {self._format_size(mbox_size)}\n\n")
-
-            f.write("FOLDER BREAKDOWN:\n")
-            f.write("-" * 40 + "\n")
-            for folder, count in sorted(email_counts.items()):
-                f.write(f"  {folder}: {count:,} emails\n")
-
-            f.write("\n" + "=" * 60 + "\n")
-
-    def _write_master_summary(self, backup_dir: Path, selected_uuids: List[str]) -> None:
+            f.write(''.join(lines))
+
+    def _write_master_summary(
+        self,
+        backup_dir: Path,
+        selected_uuids: List[str],
+        total_size: int
+    ) -> None:
         """Write master summary for the entire backup."""
         summary_path = backup_dir / "BACKUP_SUMMARY.txt"
 
-        with open(summary_path, 'w') as f:
-            f.write("=" * 60 + "\n")
-            f.write("  MAC MAIL BACKUP SUMMARY\n")
-            f.write("=" * 60 + "\n\n")
-            f.write(f"Backup Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Size:  {self._format_size(self._get_dir_size(backup_dir))}\n\n")
-
-            f.write("ACCOUNTS BACKED UP:\n")
-            f.write("-" * 40 + "\n")
-            for uuid in selected_uuids:
-                if uuid in self.accounts:
-                    data = self.accounts[uuid]
-                    f.write(f"  - {data['display_name']}\n")
-
-            f.write("\n" + "=" * 60 + "\n")
-            f.write("""
+        lines = [
+            "=" * 60 + "\n",
+            "  MAC MAIL BACKUP SUMMARY\n",
+            "=" * 60 + "\n\n",
+            f"Backup Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Total Size:  {self._format_size(total_size)}\n\n",
+            "ACCOUNTS BACKED UP:\n",
+            "-" * 40 + "\n",
+        ]
+        for uuid in selected_uuids:
+            if uuid in self.accounts:
+                data = self.accounts[uuid]
+                lines.append(f"  - {data['display_name']}\n")
+        lines.append("\n" + "=" * 60 + "\n")
+        lines.append("""
 RESTORATION INSTRUCTIONS:
 -------------------------
 
@@ -485,13 +709,21 @@ Note: The mbox files are in standard Unix mbox format
 and can be read by most email applications.
 """)
 
-    def run(self, selected_uuids: Optional[List[str]] = None) -> Optional[Path]:
+        with open(summary_path, 'w') as f:
+            f.write(''.join(lines))
+
+    def run(
+        self,
+        selected_uuids: Optional[List[str]] = None,
+        show_stats: bool = True
+    ) -> Optional[Path]:
         """
         Run the complete backup process.
 
         Args:
             selected_uuids: Optional list of account UUIDs to backup.
                            If None, will prompt for interactive selection.
+            show_stats: If True, show email counts and sizes in the listing.
 
         Returns:
             Path to backup directory, or None if cancelled.
@@ -502,12 +734,13 @@ and can be read by most email applications.
                    f"{' ' * 36}{colorize('║', Colors.BLUE)}")
         self._print(f"{colorize('╚' + '═' * 58 + '╝', Colors.BLUE)}\n")
 
-        # Discover accounts
+        # Discover accounts (reusing an earlier discovery and its cached stats)
         self._print(colorize("Scanning for mail accounts...", Colors.YELLOW))
-        self.discover_accounts()
+        if not self.accounts:
+            self.discover_accounts()
 
         # List and select accounts
-        account_uuids = self.list_accounts()
+        account_uuids = self.list_accounts(show_stats=show_stats)
 
         if not account_uuids:
             self._print(colorize("No mail accounts found!", Colors.RED))
@@ -531,14 +764,30 @@ and can be read by most email applications.
         self._print(f"\n{colorize('Starting backup...', Colors.GREEN)}")
         self._print(f"Output directory: {colorize(str(backup_dir), Colors.CYAN)}")
 
-        # Backup each selected account
-        successful = 0
-        for uuid in selected_uuids:
-            if self.backup_account(uuid, backup_dir):
-                successful += 1
+        # Resolve names up front so workers and the summary share them
+        self._resolve_details(selected_uuids)
+
+        # Backup selected accounts concurrently; each works on its own subtree.
+        # A lone account reports progress live; concurrent ones each print
+        # theirs as one block, so lines from different accounts never mix.
+        workers = min(MAX_BACKUP_WORKERS, len(selected_uuids))
+        if workers == 1:
+            results = [self.backup_account(uuid, backup_dir) for uuid in selected_uuids]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    lambda uuid: self._backup_account_buffered(uuid, backup_dir),
+                    selected_uuids
+                ))
+        successful = sum(results)
 
         # Write master summary
-        self._write_master_summary(backup_dir, selected_uuids)
+        # Sum the per-account figures rather than walking the whole backup
+        total_size = sum(
+            self.accounts[uuid].get('_backup_size', 0)
+            for uuid, ok in zip(selected_uuids, results) if ok
+        )
+        self._write_master_summary(backup_dir, selected_uuids, total_size)
 
         # Final report
         self._print(f"\n{colorize('═' * 60, Colors.GREEN)}")
@@ -546,7 +795,7 @@ and can be read by most email applications.
         self._print(f"{colorize('═' * 60, Colors.GREEN)}")
         self._print(f"\n  Accounts backed up: {successful}/{len(selected_uuids)}")
         self._print(f"  Location: {backup_dir}")
-        self._print(f"  Total size: {self._format_size(self._get_dir_size(backup_dir))}")
+        self._print(f"  Total size: {self._format_size(total_size)}")
         self._print("")
 
         return backup_dir
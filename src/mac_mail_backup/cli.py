@@ -8,7 +8,18 @@ from pathlib import Path
 from typing import List, Optional
 
 from . import __version__
-from .backup import MacMailBackup, colorize, Colors
+from .backup import MAX_BACKUP_WORKERS, MacMailBackup, colorize, Colors
+
+
+def _positive_int(value: str) -> int:
+    """Argparse type for a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value!r}")
+    return number
 
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
@@ -22,10 +33,12 @@ Examples:
   mac-mail-backup                    Interactive mode, backup to current directory
   mac-mail-backup ~/Backups          Backup to specified directory
   mac-mail-backup --list             List available accounts
+  mac-mail-backup --list --no-stats  List accounts without scanning their size
   mac-mail-backup -a 1               Backup account #1
   mac-mail-backup -a 1,2             Backup accounts #1 and #2
   mac-mail-backup --all              Backup all accounts
   mac-mail-backup -a 2 -o ~/Backups  Backup account #2 to ~/Backups
+  mac-mail-backup --all -j 4         Backup all accounts, 4 mailboxes per account at a time
 
 Output Formats:
   The backup creates two formats for each account:
@@ -71,6 +84,27 @@ More Information:
         help='Backup all accounts without prompting'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=_positive_int,
+        default=1,
+        metavar='N',
+        help='Convert up to N mailboxes per account in parallel processes; up to '
+             f'{MAX_BACKUP_WORKERS} accounts are backed up at once (default: 1)'
+    )
+
+    parser.add_argument(
+        '--no-stats',
+        action='store_true',
+        help='Skip counting emails and sizes when listing accounts (faster)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse every message instead of reusing headers cached by earlier backups'
+    )
+
     parser.add_argument(
         '-q', '--quiet',
         action='store_true',
@@ -104,19 +138,21 @@ def main(args: Optional[List[str]] = None) -> int:
     try:
         backup = MacMailBackup(
             output_dir=output_dir,
-            verbose=not parsed.quiet
+            verbose=not parsed.quiet,
+            workers=parsed.jobs,
+            use_cache=not parsed.no_cache
         )
 
         if parsed.list:
             # Just list accounts
             backup.discover_accounts()
-            backup.list_accounts()
+            backup.list_accounts(show_stats=not parsed.no_stats)
             return 0
 
         if parsed.all or parsed.account:
             # Non-interactive mode
             backup.discover_accounts()
-            account_uuids = backup.list_accounts()
+            account_uuids = backup.list_accounts(show_stats=not parsed.no_stats)
 
             if not account_uuids:
                 print(colorize("No mail accounts found.", Colors.RED), file=sys.stderr)
@@ -137,12 +173,12 @@ def main(args: Optional[List[str]] = None) -> int:
                 print(colorize("No valid accounts selected.", Colors.RED), file=sys.stderr)
                 return 1
 
-            result = backup.run(selected)
+            result = backup.run(selected, show_stats=not parsed.no_stats)
             return 0 if result else 1
 
         else:
             # Interactive mode
-            result = backup.run()
+            result = backup.run(show_stats=not parsed.no_stats)
             return 0 if result else 1
 
     except FileNotFoundError as e:
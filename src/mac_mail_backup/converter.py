@@ -4,22 +4,319 @@ Mbox format converter for Apple Mail emlx files.
 
 import os
 import re
-from datetime import datetime
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Any, Callable, Iterator, Optional, Dict, List, Tuple
+
+_WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONTHS = {name.lower(): i for i, name in enumerate(_MONTH_NAMES, 1)}
+
+# Output buffer for mbox files; large so writes reach the OS in big blocks
+MBOX_BUFFER_SIZE = 1 << 20
+
+# File names of Apple Mail messages, complete or partially downloaded
+_EMLX_SUFFIXES = ('.emlx', '.partial.emlx')
+
+# Characters not allowed in mbox file names
+_UNSAFE_NAME_RE = re.compile(r'[^\w\-_]')
+
+# Brackets are dropped from mailbox names rather than replaced
+_FOLDER_TRANS = str.maketrans('', '', '[]')
+
+
+def _format_mbox_date(value: str) -> Optional[str]:
+    """
+    Reformat an RFC 2822 date as used in mbox 'From ' lines.
+
+    Parses "[Day,] DD Mon YYYY HH:MM[:SS] [zone]" by hand, which is far
+    cheaper than trying several strptime formats per message. As with
+    strptime, the zone is ignored and the time is kept as written.
+
+    Args:
+        value: The Date header value.
+
+    Returns:
+        The date as 'Mon Jan 01 12:00:00 2024', or None if unparseable.
+    """
+    tokens = value.replace(',', ' ').split()
+    if tokens and tokens[0].isalpha():
+        tokens = tokens[1:]  # Day of week; recomputed from the date below
+    if len(tokens) < 4:
+        return None
+
+    day, month_name, year, clock = tokens[:4]
+    fields = clock.split(':')
+    if (len(day) > 2 or len(year) != 4 or len(fields) not in (2, 3)
+            or not all(f.isdigit() and len(f) <= 2 for f in fields)):
+        return None
+
+    try:
+        month = _MONTHS[month_name.lower()]
+        weekday = date(int(year), month, int(day)).weekday()
+    except (KeyError, ValueError):
+        return None
+
+    hour, minute = int(fields[0]), int(fields[1])
+    second = int(fields[2]) if len(fields) == 3 else 0
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+
+    return (f"{_WEEKDAYS[weekday]} {_MONTH_NAMES[month - 1]} {int(day):02d} "
+            f"{hour:02d}:{minute:02d}:{second:02d} {year}")
+
+
+def _scan_headers(content: bytes) -> Tuple[Optional[bytes], Optional[bytes]]:
+    """
+    Find the From and Date header values in a single pass over the headers.
+
+    Walks the header block line by line, stopping at the first blank line
+    (LF or CRLF) or as soon as both headers have been read. Folded
+    continuation lines are joined onto their header.
+
+    Args:
+        content: The raw email content.
+
+    Returns:
+        The (From, Date) values as bytes, each None if absent.
+    """
+    values: Dict[bytes, bytes] = {}
+    current: Optional[bytes] = None
+    pos = 0
+    end = len(content)
+    while pos < end:
+        eol = content.find(b'\n', pos)
+        if eol == -1:
+            eol = end
+        line = content[pos:eol]
+        pos = eol + 1
+
+        if line in (b'', b'\r'):
+            break  # Blank line ends the headers
+        if line[:1] in (b' ', b'\t'):
+            if current is not None:
+                values[current] += b' ' + line.strip()
+            continue
+
+        current = None
+        name = line[:5].lower()
+        if name in (b'from:', b'date:') and name not in values:
+            current = name
+            values[name] = line[5:].strip()
+        elif len(values) == 2:
+            break  # Both found and neither continues
+
+    return values.get(b'from:'), values.get(b'date:')
+
+
+def _walk_tree(top: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    """
+    Yield (parent directory, entry) for everything below a directory.
+
+    An iterative os.scandir walk: DirEntry type checks reuse the d_type
+    from the directory listing, so entries are classified without stat
+    calls. A directory is yielded before anything inside it. Unreadable
+    directories and entries that vanish mid-scan are skipped, matching
+    os.walk's default.
+    """
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+            except OSError:
+                continue
+            yield directory, entry
+
+
+def _inode_order(entries: List[os.DirEntry]) -> List[str]:
+    """
+    Return the paths of scanned entries sorted by inode number.
+
+    Inode numbers come from the directory listing; reading in inode order
+    tracks on-disk layout far better than path order, which helps
+    read-ahead on both spinning disks and SSDs.
+    """
+    return [entry.path for entry in sorted(entries, key=lambda entry: entry.inode())]
+
+
+def _clean_name(name: str) -> str:
+    """Turn a mailbox name into a safe file name ('[Gmail]' -> 'Gmail')."""
+    # Spaces, like every other unsafe character, become underscores
+    return _UNSAFE_NAME_RE.sub('_', name.translate(_FOLDER_TRANS))
+
+
+def _current_mbox_date() -> str:
+    """The current time formatted as an mbox 'From ' line date."""
+    return datetime.now().strftime('%a %b %d %H:%M:%S %Y')
+
+
+class _FromLineCache:
+    """
+    'From ' lines of previously converted emlx files, stored in SQLite.
+
+    Entries are keyed by path and checked against the file's mtime and
+    size, so a changed file is simply parsed again. The cache is best
+    effort: any database error disables it for the rest of the folder.
+    """
+
+    # Stored as the database's user_version; bump it whenever get_from_line
+    # output changes, so lines made by an older parser are thrown away
+    VERSION = 2
+
+    def __init__(self, cache_path: str, folder: str, emlx_files: List[str]):
+        self.folder = folder
+        self.emlx_files = emlx_files
+        self.rows: Dict[str, Tuple[int, int, str]] = {}
+        self.new_rows: List[Tuple[str, str, int, int, str]] = []
+        self.misses: Dict[str, Tuple[int, int]] = {}
+        self.conn: Optional[sqlite3.Connection] = None
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            # Folders may be converted in parallel processes; wait for locks.
+            # Transactions are begun explicitly, so each write is one lock.
+            self.conn = sqlite3.connect(cache_path, timeout=30, isolation_level=None)
+            if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.VERSION:
+                self._reset(self.conn)
+
+            # Load the folder's entries up front, not one query per message
+            cursor = self.conn.execute(
+                "SELECT path, mtime_ns, size, from_line FROM from_lines WHERE folder = ?",
+                (folder,),
+            )
+            for path, mtime_ns, size, from_line in cursor:
+                self.rows[path] = (mtime_ns, size, from_line)
+        except (OSError, sqlite3.Error):
+            self.close()
+
+    def _reset(self, conn: sqlite3.Connection) -> None:
+        """Recreate the table for the current VERSION, dropping older entries."""
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Another process may have reset it while we waited for the lock
+            if conn.execute("PRAGMA user_version").fetchone()[0] == self.VERSION:
+                return
+            conn.execute("DROP TABLE IF EXISTS from_lines")
+            conn.execute(
+                "CREATE TABLE from_lines (path TEXT PRIMARY KEY, folder TEXT NOT NULL, "
+                "mtime_ns INTEGER, size INTEGER, from_line TEXT)"
+            )
+            conn.execute("CREATE INDEX from_lines_folder ON from_lines (folder)")
+            conn.execute(f"PRAGMA user_version = {self.VERSION}")
+
+    def get(self, path: str) -> Optional[str]:
+        """
+        Return the cached 'From ' line for an unchanged file, else None.
+
+        Call this before reading the file, so an entry stored by put() can
+        never pair a newer mtime with an older file's contents.
+        """
+        if self.conn is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+        row = self.rows.get(path)
+        if row is not None and row[:2] == key:
+            return row[2]
+        self.misses[path] = key
+        return None
+
+    def put(self, path: str, from_line: str) -> None:
+        """Queue a 'From ' line, for a file get() missed, to store on close."""
+        key = self.misses.pop(path, None)
+        if key is not None:
+            self.new_rows.append((path, self.folder, key[0], key[1], from_line))
+
+    def close(self) -> None:
+        """
+        Store queued entries and forget files no longer in the folder, in one
+        transaction, then close the database.
+        """
+        if self.conn is None:
+            return
+        try:
+            stale = self.rows.keys() - set(self.emlx_files)
+            if self.new_rows or stale:
+                with self.conn:
+                    self.conn.execute("BEGIN")
+                    self.conn.executemany(
+                        "INSERT OR REPLACE INTO from_lines VALUES (?, ?, ?, ?, ?)",
+                        self.new_rows,
+                    )
+                    self.conn.executemany(
+                        "DELETE FROM from_lines WHERE path = ?",
+                        [(path,) for path in stale],
+                    )
+        except sqlite3.Error:
+            pass  # The cache is an optimization; losing an update is harmless
+        finally:
+            self.conn.close()
+            self.conn = None
+
+    @classmethod
+    def forget_missing_folders(cls, cache_path: str) -> None:
+        """Drop the entries of mailboxes that no longer exist on disk."""
+        if not os.path.exists(cache_path):
+            return
+        try:
+            conn = sqlite3.connect(cache_path, timeout=30)
+        except sqlite3.Error:
+            return
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != cls.VERSION:
+                return  # Rebuilt by the next folder that uses it
+            missing = [
+                (folder,) for folder, in conn.execute("SELECT DISTINCT folder FROM from_lines")
+                if not os.path.isdir(folder)
+            ]
+            if missing:
+                with conn:
+                    conn.executemany("DELETE FROM from_lines WHERE folder = ?", missing)
+        except sqlite3.Error:
+            pass  # The cache is an optimization; pruning can wait
+        finally:
+            conn.close()
 
 
 class MboxConverter:
     """Convert Apple Mail emlx files to standard mbox format."""
 
-    def __init__(self, verbose: bool = False):
+    # Address inside a "Name <email>" sender; subclasses may override
+    ADDRESS_RE = re.compile(rb'<([^>]+)>')
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        workers: int = 1,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize the converter.
 
         Args:
             verbose: If True, print progress information.
+            workers: Number of processes converting mailboxes in parallel.
+                     1 converts everything in the calling process.
+            cache_path: SQLite file caching each message's 'From ' line
+                        between runs. None disables the cache.
         """
         self.verbose = verbose
+        self.workers = max(1, workers)
+        self.cache_path = cache_path
 
     def parse_emlx(self, emlx_path: str) -> Optional[bytes]:
         """
@@ -37,31 +334,34 @@ class MboxConverter:
             The email content as bytes, or None if parsing failed.
         """
         try:
+            # Plain reads, not mmap: the source is the live Mail store, and a
+            # mapped file that Mail truncates would kill us with SIGBUS
             with open(emlx_path, 'rb') as f:
-                content = f.read()
-
-            # Find the first newline (end of byte count line)
-            first_newline = content.find(b'\n')
-            if first_newline == -1:
-                return None
-
-            # Parse the byte count
-            try:
-                byte_count = int(content[:first_newline].decode('ascii').strip())
-            except (ValueError, UnicodeDecodeError):
-                # Fallback: treat remaining content as email
-                byte_count = len(content) - first_newline - 1
-
-            # Extract email content
-            email_start = first_newline + 1
-            return content[email_start:email_start + byte_count]
+                # First line: the byte count
+                first_line = f.readline()
+                if not first_line.endswith(b'\n'):
+                    return None
+
+                # Parse the byte count
+                try:
+                    byte_count = int(first_line.decode('ascii').strip())
+                    if byte_count < 0:
+                        raise ValueError(byte_count)
+                except (ValueError, UnicodeDecodeError):
+                    # Fallback: treat remaining content as email
+                    return f.read()
+
+                # Read just the email, leaving the property list unread
+                return f.read(byte_count)
 
         except Exception as e:
             if self.verbose:
-                print(f"  Warning: Could not parse {emlx_path}: {e}")
+                # stderr, not the progress output: this may run in a worker
+                # process, and must not land inside another account's block
+                print(f"  Warning: Could not parse {emlx_path}: {e}", file=sys.stderr)
             return None
 
-    def get_from_line(self, email_content: bytes) -> str:
+    def get_from_line(self, email_content: bytes, default_date: Optional[str] = None) -> str:
         """
         Generate an mbox 'From ' line from email headers.
 
@@ -70,51 +370,48 @@ class MboxConverter:
 
         Args:
             email_content: The raw email content.
+            default_date: Date to use when the email has no usable Date
+                          header. Defaults to the current time.
 
         Returns:
             A properly formatted 'From ' line.
         """
+        return self._build_from_line(email_content, default_date)[0]
+
+    def _build_from_line(
+        self,
+        email_content: bytes,
+        default_date: Optional[str] = None
+    ) -> Tuple[str, bool]:
+        """Return the 'From ' line and whether its date came from the Date header."""
         try:
-            # Extract headers (everything before first blank line)
-            header_section = email_content.split(b'\n\n')[0]
-            headers = header_section.decode('utf-8', errors='replace')
+            # One pass over the headers; values stay bytes until decoded
+            sender_raw, date_raw = _scan_headers(email_content)
 
             # Extract sender
             sender = 'MAILER-DAEMON'
-            from_match = re.search(r'^From:\s*(.+?)$', headers, re.MULTILINE | re.IGNORECASE)
-            if from_match:
-                sender_raw = from_match.group(1).strip()
+            if sender_raw:
                 # Extract email from "Name <email>" format
-                email_match = re.search(r'<([^>]+)>', sender_raw)
+                email_match = self.ADDRESS_RE.search(sender_raw)
                 if email_match:
-                    sender = email_match.group(1)
-                elif '@' in sender_raw:
+                    sender = email_match.group(1).decode('utf-8', errors='replace')
+                elif b'@' in sender_raw:
                     # Plain email address
-                    sender = sender_raw.split()[0] if ' ' in sender_raw else sender_raw
+                    addr = sender_raw.split()[0] if b' ' in sender_raw else sender_raw
+                    sender = addr.decode('utf-8', errors='replace')
 
             # Extract and format date
-            date_formatted = datetime.now().strftime('%a %b %d %H:%M:%S %Y')
-            date_match = re.search(r'^Date:\s*(.+?)$', headers, re.MULTILINE | re.IGNORECASE)
-            if date_match:
-                date_str = date_match.group(1).strip()
-                # Try common email date formats
-                for fmt in [
-                    '%a, %d %b %Y %H:%M:%S %z',
-                    '%d %b %Y %H:%M:%S %z',
-                    '%a, %d %b %Y %H:%M:%S',
-                    '%d %b %Y %H:%M:%S',
-                ]:
-                    try:
-                        dt = datetime.strptime(date_str[:31], fmt)
-                        date_formatted = dt.strftime('%a %b %d %H:%M:%S %Y')
-                        break
-                    except ValueError:
-                        continue
+            date_formatted = None
+            if date_raw:
+                date_formatted = _format_mbox_date(date_raw.decode('ascii', errors='replace'))
+            dated = date_formatted is not None
+            if date_formatted is None:
+                date_formatted = default_date or _current_mbox_date()
 
-            return f"From {sender} {date_formatted}\n"
+            return f"From {sender} {date_formatted}\n", dated
 
         except Exception:
-            return f"From MAILER-DAEMON {datetime.now().strftime('%a %b %d %H:%M:%S %Y')}\n"
+            return f"From MAILER-DAEMON {default_date or _current_mbox_date()}\n", False
 
     def escape_from_lines(self, content: bytes) -> bytes:
         """
@@ -129,14 +426,12 @@ class MboxConverter:
         Returns:
             Content with 'From ' lines escaped as '>From '.
         """
-        lines = content.split(b'\n')
-        escaped = []
-        for line in lines:
-            if line.startswith(b'From '):
-                escaped.append(b'>From ' + line[5:])
-            else:
-                escaped.append(line)
-        return b'\n'.join(escaped)
+        # A single C-level replace pass; it returns the content itself,
+        # without copying, when there is nothing to escape
+        escaped = content.replace(b'\nFrom ', b'\n>From ')
+        if escaped.startswith(b'From '):
+            escaped = b'>' + escaped
+        return escaped
 
     def find_emlx_files(self, directory: str) -> List[str]:
         """
@@ -146,14 +441,41 @@ class MboxConverter:
             directory: The directory to search.
 
         Returns:
-            Sorted list of emlx file paths.
+            List of emlx file paths, in inode order.
+        """
+        return _inode_order([
+            entry for _, entry in _walk_tree(directory)
+            if entry.name.endswith(_EMLX_SUFFIXES) and not entry.is_dir(follow_symlinks=False)
+        ])
+
+    def find_mailboxes(self, source_dir: str) -> Dict[str, List[str]]:
+        """
+        Find all .mbox folders in an account and the emlx files in each.
+
+        Args:
+            source_dir: Source account directory.
+
+        Returns:
+            Dictionary mapping each .mbox folder path, in sorted order, to its
+            emlx file paths in inode order. Files belong to the nearest
+            enclosing .mbox folder, so a nested mailbox's messages are not
+            repeated in its parent.
         """
-        emlx_files = []
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.emlx') or file.endswith('.partial.emlx'):
-                    emlx_files.append(os.path.join(root, file))
-        return sorted(emlx_files)
+        # A single descent both discovers the .mbox folders and collects
+        # their emlx files, rather than walking each subtree again per folder
+        mailboxes: Dict[str, List[os.DirEntry]] = {}
+        owners: Dict[str, Optional[str]] = {source_dir: None}  # Enclosing .mbox
+        for directory, entry in _walk_tree(source_dir):
+            mailbox = owners[directory]
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name.endswith('.mbox'):
+                    mailbox = entry.path
+                    mailboxes[mailbox] = []
+                owners[entry.path] = mailbox
+            elif mailbox is not None and entry.name.endswith(_EMLX_SUFFIXES):
+                mailboxes[mailbox].append(entry)
+
+        return {folder: _inode_order(mailboxes[folder]) for folder in sorted(mailboxes)}
 
     def convert_folder(self, source_dir: str, mbox_path: str) -> int:
         """
@@ -166,80 +488,144 @@ class MboxConverter:
         Returns:
             Number of emails converted.
         """
-        emlx_files = self.find_emlx_files(source_dir)
-
+        return self._convert_files(source_dir, self.find_emlx_files(source_dir), mbox_path)[0]
+
+    def _convert_files(
+        self,
+        folder: str,
+        emlx_files: List[str],
+        mbox_path: str
+    ) -> Tuple[int, int]:
+        """Write a folder's emlx files to one mbox, returning (emails converted, mbox bytes written)."""
         if not emlx_files:
-            return 0
+            if self.cache_path:
+                # Still forget the folder's cached messages, now all deleted
+                _FromLineCache(self.cache_path, folder, emlx_files).close()
+            return 0, 0
 
         count = 0
-        with open(mbox_path, 'wb') as mbox:
-            for emlx_path in emlx_files:
-                email_content = self.parse_emlx(emlx_path)
-                if email_content:
-                    from_line = self.get_from_line(email_content)
-                    escaped_content = self.escape_from_lines(email_content)
-
-                    mbox.write(from_line.encode('utf-8'))
-                    mbox.write(escaped_content)
-                    if not escaped_content.endswith(b'\n'):
-                        mbox.write(b'\n')
-                    mbox.write(b'\n')  # Blank line between messages
-                    count += 1
+        default_date = _current_mbox_date()  # Once per folder, not per message
+        cache = _FromLineCache(self.cache_path, folder, emlx_files) if self.cache_path else None
+
+        # Hoist attribute lookups out of the per-message loop
+        parse_emlx = self.parse_emlx
+        build_from_line = self._build_from_line
+        escape_from_lines = self.escape_from_lines
+        join = b''.join
+
+        try:
+            with open(mbox_path, 'wb', buffering=MBOX_BUFFER_SIZE) as mbox:
+                write = mbox.write
+                for emlx_path in emlx_files:
+                    from_line = cache.get(emlx_path) if cache is not None else None
+                    email_content = parse_emlx(emlx_path)
+                    if not email_content:
+                        continue
 
-        return count
+                    if from_line is None:
+                        from_line, dated = build_from_line(email_content, default_date)
+                        # An undated line carries this run's time, so it is
+                        # rebuilt each run, exactly as without the cache
+                        if cache is not None and dated:
+                            cache.put(emlx_path, from_line)
 
-    def convert_account(self, source_dir: str, output_dir: str) -> Dict[str, int]:
+                    escaped_content = escape_from_lines(email_content)
+
+                    # Terminate the message, then a blank line between messages
+                    tail = b'\n' if escaped_content.endswith(b'\n') else b'\n\n'
+                    write(join((from_line.encode(), escaped_content, tail)))
+                    count += 1
+                size = mbox.tell()
+        finally:
+            if cache is not None:
+                cache.close()
+
+        return count, size
+
+    def convert_account(
+        self,
+        source_dir: str,
+        output_dir: str,
+        progress: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """
         Convert all mailboxes in an account to mbox format.
 
         Args:
             source_dir: Source account directory.
             output_dir: Output directory for mbox files.
+            progress: Called with one complete line per converted folder.
+                      Defaults to print when verbose.
 
         Returns:
-            Dictionary mapping folder names to email counts.
+            Dictionary with 'per_folder_counts', mapping folder names to
+            email counts, and 'mbox_bytes', the total size of the mbox
+            files written.
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
         email_counts = {}
+        mbox_bytes = 0
+        if progress is None and self.verbose:
+            progress = print
+
+        if self.cache_path:
+            _FromLineCache.forget_missing_folders(self.cache_path)
 
-        # Find all .mbox folders
-        mbox_folders: List[Tuple[str, str]] = []
-        for root, dirs, files in os.walk(source_dir):
-            for d in dirs:
-                if d.endswith('.mbox'):
-                    mbox_folders.append((os.path.join(root, d), d[:-5]))
+        # Find all .mbox folders along with their emlx files
+        mailboxes = self.find_mailboxes(source_dir)
+
+        jobs: List[Tuple[str, str, Path]] = []
+        for folder_path in mailboxes:
+            folder_name = os.path.basename(folder_path)[:-5]
 
-        for folder_path, folder_name in mbox_folders:
             # Clean folder name for filename
-            clean_name = folder_name.replace('[', '').replace(']', '').replace(' ', '_')
-            clean_name = re.sub(r'[^\w\-_]', '_', clean_name)
+            clean_name = _clean_name(folder_name)
 
             # Handle nested folders
             rel_path = os.path.relpath(folder_path, source_dir)
             if '/' in rel_path:
                 parts = rel_path.split('/')
-                parent = parts[0].replace('.mbox', '').replace('[', '').replace(']', '')
-                parent = re.sub(r'[^\w\-_]', '_', parent)
+                parent = _clean_name(parts[0].replace('.mbox', ''))
                 clean_name = f"{parent}_{clean_name}"
 
             mbox_path = output_path / f"{clean_name}.mbox"
+            jobs.append((folder_name, clean_name, mbox_path))
+
+        # Each mailbox is written to its own file, so mailboxes can be
+        # converted in separate processes without any message data crossing
+        # the process boundary. The serial path uses the lazy built-in map,
+        # so each folder is converted as its progress line is printed.
+        folders = list(mailboxes)
+        file_lists = list(mailboxes.values())
+        mbox_paths = [str(job[2]) for job in jobs]
+        executor = None
+        if self.workers > 1 and len(jobs) > 1:
+            executor = ProcessPoolExecutor(max_workers=min(self.workers, len(jobs)))
+            results = executor.map(self._convert_files, folders, file_lists, mbox_paths)
+        else:
+            results = map(self._convert_files, folders, file_lists, mbox_paths)
 
-            if self.verbose:
-                print(f"    Converting: {folder_name}...", end=' ', flush=True)
-
-            count = self.convert_folder(folder_path, str(mbox_path))
-
-            if count > 0:
-                if self.verbose:
-                    print(f"{count:,} emails")
-                email_counts[clean_name] = count
-            else:
-                # Remove empty mbox file
-                if mbox_path.exists():
-                    mbox_path.unlink()
-                if self.verbose:
-                    print("(empty)")
-
-        return email_counts
+        try:
+            for folder_name, clean_name, mbox_path in jobs:
+                count, size = next(results)
+
+                if count > 0:
+                    outcome = f"{count:,} emails"
+                    email_counts[clean_name] = count
+                    mbox_bytes += size
+                else:
+                    # Remove empty mbox file
+                    if mbox_path.exists():
+                        mbox_path.unlink()
+                    outcome = "(empty)"
+
+                # Whole lines only, so concurrent accounts cannot split them
+                if progress is not None:
+                    progress(f"    Converting: {folder_name}... {outcome}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return {'per_folder_counts': email_counts, 'mbox_bytes': mbox_bytes}
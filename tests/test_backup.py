@@ -0,0 +1,85 @@
+"""Tests for the backup module."""
+
+import sqlite3
+
+import pytest
+
+from mac_mail_backup.backup import MacMailBackup
+
+
+UUID_A = "11111111-2222-3333-4444-555555555555"
+UUID_B = "AAAAAAAA-BBBB-CCCC-DDDD-EEEEEEEEEEEE"
+UUID_C = "99999999-8888-7777-6666-555555555555"
+
+
+@pytest.fixture
+def make_backup(tmp_path):
+    """Build a MacMailBackup over an Envelope Index holding the given mailbox URLs."""
+    def make(urls):
+        version_dir = tmp_path / "Mail" / "V10"
+        (version_dir / "MailData").mkdir(parents=True)
+        (version_dir / UUID_A).mkdir()
+
+        conn = sqlite3.connect(str(version_dir / "MailData" / "Envelope Index"))
+        conn.execute("CREATE TABLE mailboxes (ROWID INTEGER PRIMARY KEY, url TEXT)")
+        conn.executemany("INSERT INTO mailboxes (url) VALUES (?)", [(url,) for url in urls])
+        conn.commit()
+        conn.close()
+
+        backup = MacMailBackup(output_dir=str(tmp_path / "out"), verbose=False)
+        backup.mail_version = version_dir
+        return backup
+    return make
+
+
+class TestDiscoverAccounts:
+    """Test suite for account discovery from the Envelope Index."""
+
+    def test_account_types(self, make_backup):
+        """Test schemes map to account types regardless of case."""
+        backup = make_backup([
+            f"IMAP://{UUID_A}/INBOX",
+            f"Ews://{UUID_B}/Inbox",
+            f"gmail://{UUID_C}/INBOX",
+        ])
+        accounts = backup.discover_accounts()
+
+        assert accounts[UUID_A]["type"] == "IMAP"
+        assert accounts[UUID_B]["type"] == "Exchange"
+        assert accounts[UUID_C]["type"] == "Other"
+
+    def test_invalid_uuid_rejected(self, make_backup):
+        """Test URLs without a full-length account UUID are ignored."""
+        backup = make_backup([
+            f"imap://{UUID_A}/INBOX",
+            "imap://short-uuid/INBOX",
+            f"imap://{UUID_B[:30]}",
+            "not a mailbox url",
+        ])
+        accounts = backup.discover_accounts()
+
+        assert list(accounts) == [UUID_A]
+
+    def test_mailbox_paths(self, make_backup):
+        """Test mailbox paths are extracted, decoded and de-duplicated."""
+        backup = make_backup([
+            f"imap://{UUID_A}",
+            f"imap://{UUID_A}/",
+            f"imap://{UUID_A}/INBOX",
+            f"imap://{UUID_A}/Archive/",
+            f"imap://{UUID_A}/%5BGmail%5D/Sent%20Mail",
+            f"imap://{UUID_A}/[Gmail]/Sent Mail",
+        ])
+        accounts = backup.discover_accounts()
+
+        assert sorted(accounts[UUID_A]["mailboxes"]) == [
+            "Archive/", "INBOX", "[Gmail]/Sent Mail"
+        ]
+
+    def test_account_path(self, make_backup):
+        """Test only accounts with a directory on disk get a path."""
+        backup = make_backup([f"imap://{UUID_A}/INBOX", f"imap://{UUID_B}/INBOX"])
+        accounts = backup.discover_accounts()
+
+        assert accounts[UUID_A]["path"] == backup.mail_version / UUID_A
+        assert accounts[UUID_B]["path"] is None
@@ -15,6 +15,9 @@ class TestParseArgs:
         assert args.list is False
         assert args.account is None
         assert args.all is False
+        assert args.no_stats is False
+        assert args.jobs == 1
+        assert args.no_cache is False
         assert args.quiet is False
 
     def test_output_dir_positional(self):
@@ -52,6 +55,28 @@ class TestParseArgs:
         args = parse_args(["--all"])
         assert args.all is True
 
+    def test_jobs_option(self):
+        """Test -j/--jobs option."""
+        assert parse_args(["-j", "4"]).jobs == 4
+        assert parse_args(["--jobs", "2"]).jobs == 2
+
+    @pytest.mark.parametrize("value", ["0", "-3", "two"])
+    def test_jobs_must_be_positive(self, value, capsys):
+        """Test -j rejects values below 1."""
+        with pytest.raises(SystemExit):
+            parse_args(["-j", value])
+        assert "positive integer" in capsys.readouterr().err
+
+    def test_no_stats_flag(self):
+        """Test --no-stats flag."""
+        args = parse_args(["--list", "--no-stats"])
+        assert args.list is True
+        assert args.no_stats is True
+
+    def test_no_cache_flag(self):
+        """Test --no-cache flag."""
+        assert parse_args(["--all", "--no-cache"]).no_cache is True
+
     def test_quiet_flag(self):
         """Test --quiet flag."""
         args = parse_args(["-q"])
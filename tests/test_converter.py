@@ -2,6 +2,8 @@
 
 import tempfile
 import os
+import shutil
+import sqlite3
 from pathlib import Path
 
 import pytest
@@ -9,6 +11,19 @@ import pytest
 from mac_mail_backup.converter import MboxConverter
 
 
+DATED_EMAIL = (b"From: test@example.com\r\nDate: Mon, 1 Jan 2024 12:00:00 +0000\r\n"
+               b"Subject: Test\r\n\r\nBody")
+
+
+def _cached_paths(cache_path):
+    """Paths with a cached 'From ' line, sorted."""
+    conn = sqlite3.connect(str(cache_path))
+    try:
+        return sorted(row[0] for row in conn.execute("SELECT path FROM from_lines"))
+    finally:
+        conn.close()
+
+
 class TestMboxConverter:
     """Test suite for MboxConverter class."""
 
@@ -20,6 +35,9 @@ class TestMboxConverter:
         converter_verbose = MboxConverter(verbose=True)
         assert converter_verbose.verbose is True
 
+        assert converter.workers == 1
+        assert MboxConverter(workers=0).workers == 1
+
     def test_parse_emlx_valid(self, tmp_path):
         """Test parsing a valid emlx file."""
         # Create a mock emlx file
@@ -36,12 +54,37 @@ class TestMboxConverter:
         assert b"From: test@example.com" in result
         assert b"This is the body." in result
 
+    def test_parse_emlx_empty(self, tmp_path):
+        """Test parsing an empty emlx file."""
+        emlx_file = tmp_path / "empty.emlx"
+        emlx_file.touch()
+
+        converter = MboxConverter()
+        assert converter.parse_emlx(str(emlx_file)) is None
+
+    def test_parse_emlx_truncated(self, tmp_path):
+        """Test an emlx file shorter than its byte count yields what is there."""
+        emlx_file = tmp_path / "truncated.emlx"
+        emlx_file.write_bytes(b"1000\nFrom: test@example.com\r\n")
+
+        converter = MboxConverter()
+        assert converter.parse_emlx(str(emlx_file)) == b"From: test@example.com\r\n"
+
     def test_parse_emlx_nonexistent(self):
         """Test parsing a non-existent file."""
         converter = MboxConverter()
         result = converter.parse_emlx("/nonexistent/path/file.emlx")
         assert result is None
 
+    def test_parse_emlx_warning_on_stderr(self, capsys):
+        """Test parse warnings go to stderr, apart from progress output."""
+        converter = MboxConverter(verbose=True)
+        converter.parse_emlx("/nonexistent/path/file.emlx")
+
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "Warning: Could not parse /nonexistent/path/file.emlx" in captured.err
+
     def test_get_from_line(self):
         """Test generating mbox From line."""
         converter = MboxConverter()
@@ -73,6 +116,13 @@ class TestMboxConverter:
         # The "From " at the start of a line should be escaped to ">From "
         assert b"\nFrom " not in escaped
 
+    def test_escape_from_lines_at_start(self):
+        """Test escaping a 'From ' line at the very start of the content."""
+        converter = MboxConverter()
+        escaped = converter.escape_from_lines(b"From here\nFrom there\n")
+
+        assert escaped == b">From here\n>From there\n"
+
     def test_find_emlx_files(self, tmp_path):
         """Test finding emlx files recursively."""
         # Create directory structure with emlx files
@@ -89,6 +139,36 @@ class TestMboxConverter:
         assert len(files) == 3
         assert all(f.endswith('.emlx') for f in files)
 
+    def test_find_emlx_files_inode_order(self, tmp_path):
+        """Test emlx files are returned in inode order, not name order."""
+        for name in ("c.emlx", "a.emlx", "b.emlx"):
+            (tmp_path / name).touch()
+
+        converter = MboxConverter()
+        files = converter.find_emlx_files(str(tmp_path))
+
+        assert files == sorted(files, key=lambda path: os.stat(path).st_ino)
+
+    def test_find_mailboxes(self, tmp_path):
+        """Test emlx files are assigned to their nearest .mbox folder."""
+        parent = tmp_path / "Parent.mbox" / "Messages"
+        child = tmp_path / "Parent.mbox" / "Child.mbox" / "Messages"
+        child.mkdir(parents=True)
+        parent.mkdir()
+        (parent / "1.emlx").touch()
+        (child / "2.emlx").touch()
+        (tmp_path / "Empty.mbox").mkdir()
+        (tmp_path / "stray.emlx").touch()
+
+        converter = MboxConverter()
+        mailboxes = converter.find_mailboxes(str(tmp_path))
+
+        assert mailboxes == {
+            str(tmp_path / "Empty.mbox"): [],
+            str(tmp_path / "Parent.mbox"): [str(parent / "1.emlx")],
+            str(tmp_path / "Parent.mbox" / "Child.mbox"): [str(child / "2.emlx")],
+        }
+
     def test_convert_folder_empty(self, tmp_path):
         """Test converting an empty folder."""
         source = tmp_path / "source"
@@ -102,6 +182,134 @@ class TestMboxConverter:
         assert count == 0
         assert not output.exists()
 
+    def test_convert_account(self, tmp_path):
+        """Test converting an account reports counts and mbox size."""
+        email_content = b"From: test@example.com\r\nSubject: Test\r\n\r\nBody"
+        emlx_content = f"{len(email_content)}\n".encode() + email_content + b"\n<?xml version..."
+
+        messages = tmp_path / "source" / "INBOX.mbox" / "Data" / "Messages"
+        messages.mkdir(parents=True)
+        (messages / "1.emlx").write_bytes(emlx_content)
+        (messages / "2.emlx").write_bytes(emlx_content)
+        (tmp_path / "source" / "Empty.mbox").mkdir()
+
+        output = tmp_path / "output"
+
+        converter = MboxConverter()
+        result = converter.convert_account(str(tmp_path / "source"), str(output))
+
+        assert result["per_folder_counts"] == {"INBOX": 2}
+        assert result["mbox_bytes"] == (output / "INBOX.mbox").stat().st_size
+        assert not (output / "Empty.mbox").exists()
+
+    def test_convert_account_parallel(self, tmp_path):
+        """Test parallel conversion matches serial conversion."""
+        # A fixed Date keeps both runs' 'From ' lines independent of the clock
+        email_content = (b"From: test@example.com\r\nDate: Mon, 1 Jan 2024 12:00:00 +0000\r\n"
+                         b"Subject: Test\r\n\r\nBody")
+        emlx_content = f"{len(email_content)}\n".encode() + email_content + b"\n<?xml version..."
+
+        for folder, count in (("INBOX", 3), ("Sent", 2), ("Archive", 1)):
+            messages = tmp_path / "source" / f"{folder}.mbox" / "Messages"
+            messages.mkdir(parents=True)
+            for i in range(count):
+                (messages / f"{i}.emlx").write_bytes(emlx_content)
+
+        serial = MboxConverter().convert_account(
+            str(tmp_path / "source"), str(tmp_path / "serial"))
+        parallel = MboxConverter(workers=2).convert_account(
+            str(tmp_path / "source"), str(tmp_path / "parallel"))
+
+        assert parallel == serial
+        assert serial["per_folder_counts"] == {"INBOX": 3, "Sent": 2, "Archive": 1}
+        for name in ("INBOX", "Sent", "Archive"):
+            assert ((tmp_path / "parallel" / f"{name}.mbox").read_bytes()
+                    == (tmp_path / "serial" / f"{name}.mbox").read_bytes())
+
+    def test_convert_folder_cache(self, tmp_path):
+        """Test cached 'From ' lines are reused until the file changes."""
+        email_content = DATED_EMAIL
+        emlx = tmp_path / "source" / "1.emlx"
+        emlx.parent.mkdir()
+        emlx.write_bytes(f"{len(email_content)}\n".encode() + email_content)
+        cache_path = tmp_path / "cache" / "from_lines.sqlite"
+        output = tmp_path / "output.mbox"
+
+        converter = MboxConverter(cache_path=str(cache_path))
+        assert converter.convert_folder(str(tmp_path / "source"), str(output)) == 1
+        assert output.read_bytes().startswith(b"From test@example.com ")
+        assert _cached_paths(cache_path) == [str(emlx)]
+
+        # A cached line is used as-is for an unchanged file
+        with sqlite3.connect(str(cache_path)) as conn:
+            conn.execute("UPDATE from_lines SET from_line = 'From cached@example.com x\n'")
+        conn.close()
+        converter.convert_folder(str(tmp_path / "source"), str(output))
+        assert output.read_bytes().startswith(b"From cached@example.com x\n")
+
+        # A changed file is parsed again
+        emlx.write_bytes(f"{len(email_content)}\n".encode() + email_content + b"\n<plist/>")
+        converter.convert_folder(str(tmp_path / "source"), str(output))
+        assert output.read_bytes().startswith(b"From test@example.com ")
+
+    def test_convert_folder_cache_maintenance(self, tmp_path):
+        """Test the cache forgets deleted files and entries from older versions."""
+        email_content = DATED_EMAIL
+        source = tmp_path / "source"
+        source.mkdir()
+        for name in ("1.emlx", "2.emlx"):
+            (source / name).write_bytes(f"{len(email_content)}\n".encode() + email_content)
+        cache_path = tmp_path / "from_lines.sqlite"
+        output = tmp_path / "output.mbox"
+
+        converter = MboxConverter(cache_path=str(cache_path))
+        converter.convert_folder(str(source), str(output))
+        assert _cached_paths(cache_path) == [str(source / "1.emlx"), str(source / "2.emlx")]
+
+        (source / "2.emlx").unlink()
+        converter.convert_folder(str(source), str(output))
+        assert _cached_paths(cache_path) == [str(source / "1.emlx")]
+
+        # Lines cached by another format version are not reused
+        conn = sqlite3.connect(str(cache_path))
+        conn.execute("UPDATE from_lines SET from_line = 'From stale@example.com x\n'")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+        converter.convert_folder(str(source), str(output))
+        assert output.read_bytes().startswith(b"From test@example.com ")
+
+    def test_convert_folder_cache_skips_undated(self, tmp_path):
+        """Test lines using the fallback date are rebuilt, never cached."""
+        email_content = b"From: test@example.com\r\nSubject: Test\r\n\r\nBody"
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "1.emlx").write_bytes(f"{len(email_content)}\n".encode() + email_content)
+        cache_path = tmp_path / "from_lines.sqlite"
+
+        converter = MboxConverter(cache_path=str(cache_path))
+        assert converter.convert_folder(str(source), str(tmp_path / "output.mbox")) == 1
+        assert _cached_paths(cache_path) == []
+
+    def test_convert_account_cache_forgets_missing_mailboxes(self, tmp_path):
+        """Test entries for mailboxes deleted from disk are dropped."""
+        email_content = DATED_EMAIL
+        for folder in ("INBOX", "Old"):
+            messages = tmp_path / "source" / f"{folder}.mbox" / "Messages"
+            messages.mkdir(parents=True)
+            (messages / "1.emlx").write_bytes(f"{len(email_content)}\n".encode() + email_content)
+        cache_path = tmp_path / "from_lines.sqlite"
+
+        converter = MboxConverter(cache_path=str(cache_path))
+        converter.convert_account(str(tmp_path / "source"), str(tmp_path / "output"))
+        assert len(_cached_paths(cache_path)) == 2
+
+        shutil.rmtree(tmp_path / "source" / "Old.mbox")
+        converter.convert_account(str(tmp_path / "source"), str(tmp_path / "output"))
+        assert _cached_paths(cache_path) == [
+            str(tmp_path / "source" / "INBOX.mbox" / "Messages" / "1.emlx")
+        ]
+
 
 class TestFromLineGeneration:
     """Additional tests for From line generation edge cases."""
@@ -114,6 +322,39 @@ class TestFromLineGeneration:
 
         assert "MAILER-DAEMON" in from_line
 
+    def test_date_formatting(self):
+        """Test the Date header is reformatted for the From line."""
+        converter = MboxConverter()
+        email = b"From: sender@example.com\r\nDate: Tue, 1 Jan 2024 09:05:07 +0000\r\n\r\nBody"
+        from_line = converter.get_from_line(email)
+
+        # Weekday comes from the date itself, not the header
+        assert from_line == "From sender@example.com Mon Jan 01 09:05:07 2024\n"
+
+    def test_date_without_seconds_or_numeric_zone(self):
+        """Test lenient parsing of less common date layouts."""
+        converter = MboxConverter()
+        email = b"From: sender@example.com\r\nDate: 15 May 2024 18:30 GMT\r\n\r\nBody"
+        from_line = converter.get_from_line(email)
+
+        assert from_line == "From sender@example.com Wed May 15 18:30:00 2024\n"
+
+    def test_folded_from_header(self):
+        """Test a From header folded onto a continuation line."""
+        converter = MboxConverter()
+        email = b"From: \"A Very Long Display Name\"\r\n <long@example.com>\r\n\r\nBody"
+        from_line = converter.get_from_line(email)
+
+        assert from_line.startswith("From long@example.com ")
+
+    def test_headers_end_at_blank_line(self):
+        """Test body lines are never read as headers."""
+        converter = MboxConverter()
+        email = b"To: recipient@example.com\r\n\r\nFrom: quoted@example.com\r\n"
+        from_line = converter.get_from_line(email)
+
+        assert "MAILER-DAEMON" in from_line
+
     def test_missing_date_header(self):
         """Test handling missing Date header."""
         converter = MboxConverter()
@@ -124,6 +365,14 @@ class TestFromLineGeneration:
         assert from_line.startswith("From ")
         assert "sender@example.com" in from_line
 
+    def test_default_date(self):
+        """Test the supplied default date is used when Date is missing."""
+        converter = MboxConverter()
+        email = b"From: sender@example.com\r\n\r\nBody"
+        from_line = converter.get_from_line(email, "Sat Jan 06 00:00:00 2024")
+
+        assert from_line == "From sender@example.com Sat Jan 06 00:00:00 2024\n"
+
     def test_malformed_email(self):
         """Test handling malformed email content."""
         converter = MboxConverter()